@@ -46,6 +46,7 @@ class Settings(BaseSettings):
     # Performance
     ollama_timeout: int = 60  # seconds
     websocket_timeout: int = 30
+    max_ws_connections: int = 50  # /ws clients; extra handshakes get 1013
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
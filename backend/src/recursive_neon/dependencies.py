@@ -6,6 +6,7 @@ Implements the Service Locator pattern for clean dependency injection.
 """
 
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -23,13 +24,13 @@ from recursive_neon.services.interfaces import (
     IProcessManager,
 )
 from recursive_neon.services.npc_manager import NPCManager
-from recursive_neon.services.ollama_client import OllamaClient
+from recursive_neon.services.ollama_client import OLLAMA_HTTP_LIMITS, OllamaClient
 from recursive_neon.services.process_manager import OllamaProcessManager
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceContainer:
     """
     Container for all application services.
@@ -46,6 +47,22 @@ class ServiceContainer:
     start_time: datetime
     process_table: ProcessTable = field(default_factory=ProcessTable)
     event_bus: GameEventBus = field(default_factory=GameEventBus)
+    # ISO-8601 form of start_time, formatted once so polled endpoints
+    # (/health, /stats) don't re-encode the datetime on every request.
+    start_time_iso: str = field(init=False)
+    # Monotonic-clock reading that corresponds to start_time; uptime is
+    # measured against it so probes don't build datetimes (and wall-clock
+    # adjustments can't make uptime jump or go negative).
+    start_monotonic: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.start_time_iso = self.start_time.isoformat()
+        elapsed = (datetime.now(tz=UTC) - self.start_time).total_seconds()
+        self.start_monotonic = time.monotonic() - elapsed
+
+    def uptime_seconds(self) -> float:
+        """Seconds elapsed since start_time."""
+        return time.monotonic() - self.start_monotonic
 
     def __repr__(self) -> str:
         return (
@@ -98,6 +115,9 @@ class ServiceFactory:
                 base_url=f"http://{host}:{port}",
                 model=settings.default_model,
                 temperature=0.7,
+                # ChatOllama builds its own httpx client internally and
+                # cannot take ours, so match the OllamaClient pool instead.
+                async_client_kwargs={"limits": OLLAMA_HTTP_LIMITS},
             )
         return NPCManager(llm=llm)
 
@@ -201,7 +221,11 @@ _container: ServiceContainer | None = None
 
 
 def get_container() -> ServiceContainer:
-    """Get the global service container (for FastAPI dependency injection)."""
+    """Get the global service container.
+
+    HTTP and WebSocket handlers read the container from ``app.state``
+    directly; this accessor is for code that runs outside a request.
+    """
     if _container is None:
         raise RuntimeError(
             "Service container not initialized. "
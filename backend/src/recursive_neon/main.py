@@ -11,21 +11,25 @@ FastAPI server that manages:
 import asyncio
 import contextlib
 import logging
+import sys
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
-from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 
 from recursive_neon.config import settings
 from recursive_neon.dependencies import (
     ServiceContainer,
     ServiceFactory,
-    get_container,
     initialize_container,
 )
 from recursive_neon.models.game_state import StatusResponse, SystemStatus
-from recursive_neon.models.npc import ChatRequest, ChatResponse, NPCListResponse
+from recursive_neon.models.npc import NPC, ChatRequest, ChatResponse, NPCListResponse
+from recursive_neon.services.app_service import MissingFieldError
 from recursive_neon.terminal import TerminalSessionManager
 
 # Configure logging
@@ -74,6 +78,12 @@ async def lifespan(app: FastAPI):
         logger.info(f"Available models: {models}")
         container.system_state.ollama_models_loaded = models
 
+        # Load the NPC model once up front so the first chat doesn't pay
+        # the weight-loading latency.  Non-fatal: chat still works cold.
+        logger.info(f"Preloading model {settings.default_model}...")
+        if not await container.ollama_client.preload_model(settings.default_model):
+            logger.warning("Model preload failed; first chat will load it")
+
         # NPC state is already loaded by create_production_container()
         # (from disk if available, otherwise defaults are created there).
         npcs = container.npc_manager.list_npcs()
@@ -103,15 +113,21 @@ async def lifespan(app: FastAPI):
         if container:
             container.system_state.status = SystemStatus.SHUTTING_DOWN
 
-            # Save all game state
+            # Save all game state.  App state and NPC state go to separate
+            # files, so write them concurrently in worker threads — shutdown
+            # then waits for the slowest save rather than the sum of both.
             logger.info("Saving game state...")
-            try:
-                data_dir = str(settings.data_dir)
-                container.app_service.save_all_to_disk(data_dir)
-                container.npc_manager.save_npcs_to_disk(data_dir)
+            data_dir = str(settings.data_dir)
+            results = await asyncio.gather(
+                asyncio.to_thread(container.app_service.save_all_to_disk, data_dir),
+                asyncio.to_thread(container.npc_manager.save_npcs_to_disk, data_dir),
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            for err in errors:
+                logger.error(f"Failed to save game state: {err}")
+            if not errors:
                 logger.info("Game state saved successfully")
-            except Exception as e:
-                logger.error(f"Failed to save game state: {e}")
 
             await container.ollama_client.close()
             await container.process_manager.stop()
@@ -140,10 +156,22 @@ app.add_middleware(
 # ============================================================================
 # HTTP Endpoints
 # ============================================================================
+#
+# The container is a process-wide singleton stored on ``app.state`` by the
+# lifespan.  Handlers read it from the request instead of going through
+# ``Depends(get_container)``, so FastAPI doesn't solve a dependency graph
+# on every request.
+
+
+def _services(conn: Request | WebSocket) -> ServiceContainer:
+    """Return the service container attached to the app by ``lifespan``."""
+    container: ServiceContainer = conn.app.state.services
+    return container
 
 
 @app.get("/")
-async def root(container: ServiceContainer = Depends(get_container)):
+async def root(request: Request):
+    container = _services(request)
     return {
         "name": "Recursive://Neon",
         "version": "0.2.0",
@@ -152,25 +180,32 @@ async def root(container: ServiceContainer = Depends(get_container)):
 
 
 @app.get("/health", response_model=StatusResponse)
-async def health_check(container: ServiceContainer = Depends(get_container)):
-    uptime = (datetime.now(tz=UTC) - container.start_time).total_seconds()
-    container.system_state.uptime_seconds = uptime
-    return StatusResponse(
-        status="healthy"
-        if container.system_state.status == SystemStatus.READY
-        else "unhealthy",
-        system=container.system_state,
-    )
+async def health_check(request: Request):
+    container = _services(request)
+    state = container.system_state
+    # Return a plain dict and let the response_model validate it once; live
+    # uptime goes into the dict so the shared system state is never written.
+    return {
+        "status": "healthy" if state.status == SystemStatus.READY else "unhealthy",
+        "system": state.to_stats_dict(uptime_seconds=container.uptime_seconds()),
+        "started_at": container.start_time_iso,
+        "timestamp": datetime.now(tz=UTC),
+    }
 
 
 @app.get("/npcs", response_model=NPCListResponse)
-async def list_npcs(container: ServiceContainer = Depends(get_container)):
+async def list_npcs(request: Request):
+    container = _services(request)
     npcs = container.npc_manager.list_npcs()
     return NPCListResponse(npcs=npcs)
 
 
-@app.get("/npcs/{npc_id}")
-async def get_npc(npc_id: str, container: ServiceContainer = Depends(get_container)):
+# Declaring a response_model lets FastAPI serialize straight to JSON bytes
+# through Pydantic's Rust core.  That fast path is only taken with the
+# default response class, so don't set default_response_class on the app.
+@app.get("/npcs/{npc_id}", response_model=NPC)
+async def get_npc(npc_id: str, request: Request):
+    container = _services(request)
     npc = container.npc_manager.get_npc(npc_id)
     if not npc:
         raise HTTPException(status_code=404, detail=f"NPC not found: {npc_id}")
@@ -178,12 +213,13 @@ async def get_npc(npc_id: str, container: ServiceContainer = Depends(get_contain
 
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat_with_npc(
-    request: ChatRequest, container: ServiceContainer = Depends(get_container)
-):
+async def chat_with_npc(chat_request: ChatRequest, request: Request):
+    container = _services(request)
     try:
         response = await container.npc_manager.chat(
-            npc_id=request.npc_id, message=request.message, player_id=request.player_id
+            npc_id=chat_request.npc_id,
+            message=chat_request.message,
+            player_id=chat_request.player_id,
         )
         return response
     except ValueError as e:
@@ -194,11 +230,16 @@ async def chat_with_npc(
 
 
 @app.get("/stats")
-async def get_stats(container: ServiceContainer = Depends(get_container)):
+async def get_stats(request: Request):
+    container = _services(request)
     return {
-        "system": container.system_state.model_dump(),
+        "system": container.system_state.to_stats_dict(
+            uptime_seconds=container.uptime_seconds()
+        ),
+        "started_at": container.start_time_iso,
         "ollama_process": container.process_manager.get_status(),
         "npc_manager": container.npc_manager.get_stats(),
+        "websocket": ws_manager.get_stats(),
     }
 
 
@@ -207,20 +248,40 @@ async def get_stats(container: ServiceContainer = Depends(get_container)):
 # ============================================================================
 
 
+def encode_frame(message: dict) -> str:
+    """Encode a message dict as a compact JSON text frame.
+
+    Uses pydantic-core's Rust serializer, which is several times faster
+    than the stdlib encoder behind Starlette's ``send_json`` and emits the
+    same compact, non-ASCII-escaped output.
+    """
+    return to_json(message).decode()
+
+
+# Pings are the most frequent message and their reply never varies, so
+# websocket_endpoint sends this pre-encoded frame without dispatching.
+_PONG_FRAME = encode_frame({"type": "pong", "data": {}})
+
+
 class ConnectionManager:
     """Manages WebSocket connections."""
 
-    MAX_CONNECTIONS = 50
-
-    def __init__(self):
+    def __init__(self, max_connections: int | None = None):
         self.active_connections: set[WebSocket] = set()
+        self.max_connections = (
+            max_connections
+            if max_connections is not None
+            else settings.max_ws_connections
+        )
+        self.rejected_connections = 0
 
     async def connect(self, websocket: WebSocket) -> bool:
         """Accept a WebSocket connection. Returns False if limit reached."""
-        if len(self.active_connections) >= self.MAX_CONNECTIONS:
+        if len(self.active_connections) >= self.max_connections:
             await websocket.close(code=1013, reason="Server overloaded")
+            self.rejected_connections += 1
             logger.warning(
-                "Connection rejected: limit reached (%d)", self.MAX_CONNECTIONS
+                "Connection rejected: limit reached (%d)", self.max_connections
             )
             return False
         await websocket.accept()
@@ -232,33 +293,54 @@ class ConnectionManager:
         self.active_connections.discard(websocket)
         logger.info(f"Client disconnected. Total: {len(self.active_connections)}")
 
+    def get_stats(self) -> dict:
+        return {
+            "active_connections": len(self.active_connections),
+            "max_connections": self.max_connections,
+            "rejected_connections": self.rejected_connections,
+        }
+
     async def send_personal(self, message: dict, websocket: WebSocket):
-        await websocket.send_json(message)
+        await websocket.send_text(encode_frame(message))
 
     async def broadcast(self, message: dict):
-        for connection in list(self.active_connections):
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
+        # Encode once for all recipients instead of once per send_json call,
+        # and send concurrently so one slow client doesn't delay the rest.
+        frame = encode_frame(message)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(conn.send_text(frame) for conn in connections),
+            return_exceptions=True,
+        )
+        # Drop sockets that failed so later broadcasts don't keep paying
+        # for sends that can never succeed.
+        for conn, result in zip(connections, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to client: {result}")
+                self.disconnect(conn)
 
 
 ws_manager = ConnectionManager()
 
 
 @app.websocket("/ws")
-async def websocket_endpoint(
-    websocket: WebSocket, container: ServiceContainer = Depends(get_container)
-):
+async def websocket_endpoint(websocket: WebSocket):
     """
     Main WebSocket endpoint for real-time communication.
 
+    The container is resolved once per connection from ``app.state``
+    rather than through ``Depends`` on every handshake.
+
     Message format:
     {
         "type": "chat" | "get_npcs" | "ping" | "app",
         "data": { ... }
     }
     """
+    # Resolve the container before taking a connection slot: if it is
+    # missing (startup, failed lifespan) the slot would otherwise leak.
+    container = _services(websocket)
+
     if not await ws_manager.connect(websocket):
         return
 
@@ -270,48 +352,68 @@ async def websocket_endpoint(
 
             logger.debug(f"WebSocket message: {msg_type}")
 
+            if msg_type == "ping":
+                await websocket.send_text(_PONG_FRAME)
+                continue
+
             response = await handle_ws_message(container, msg_type, msg_data)
             await ws_manager.send_personal(response, websocket)
 
     except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        ws_manager.disconnect(websocket)
         with contextlib.suppress(Exception):
             await websocket.close(code=1011, reason="Internal error")
+    finally:
+        # Runs on every exit path, including task cancellation at shutdown,
+        # so the manager never keeps a reference to a dead socket.
+        ws_manager.disconnect(websocket)
 
 
-async def handle_ws_message(
-    container: ServiceContainer, msg_type: str, msg_data: dict
-) -> dict:
-    """Route WebSocket messages to appropriate handlers."""
-    try:
-        if msg_type == "ping":
-            return {"type": "pong", "data": {}}
+# Serializer for the npcs_list payload, built once.  A single dump_python
+# call over the list is cheaper than a model_dump() per NPC.
+_npc_list_adapter = TypeAdapter(list[NPC])
 
-        elif msg_type == "get_npcs":
-            npcs = container.npc_manager.list_npcs()
-            return {
-                "type": "npcs_list",
-                "data": {"npcs": [npc.model_dump(mode="json") for npc in npcs]},
-            }
 
-        elif msg_type == "chat":
-            npc_id = str(msg_data.get("npc_id", ""))
-            message = str(msg_data.get("message", ""))
-            response = await container.npc_manager.chat(npc_id, message)
-            return {"type": "chat_response", "data": response.model_dump(mode="json")}
+WSHandler = Callable[[ServiceContainer, dict], Awaitable[dict]]
 
-        elif msg_type == "app":
-            return await handle_app_message(container, msg_data)
 
-        else:
-            return {
-                "type": "error",
-                "data": {"message": f"Unknown message type: {msg_type}"},
-            }
+async def _ws_ping(container: ServiceContainer, msg_data: dict) -> dict:
+    return {"type": "pong", "data": {}}
+
+
+async def _ws_get_npcs(container: ServiceContainer, msg_data: dict) -> dict:
+    npcs = container.npc_manager.list_npcs()
+    return {
+        "type": "npcs_list",
+        "data": {"npcs": _npc_list_adapter.dump_python(npcs, mode="json")},
+    }
+
+
+async def _ws_chat(container: ServiceContainer, msg_data: dict) -> dict:
+    npc_id = str(msg_data.get("npc_id", ""))
+    message = str(msg_data.get("message", ""))
+    response = await container.npc_manager.chat(npc_id, message)
+    return {"type": "chat_response", "data": response.model_dump(mode="json")}
 
+
+async def handle_ws_message(
+    container: ServiceContainer, msg_type: str, msg_data: dict
+) -> dict:
+    """Route WebSocket messages to appropriate handlers."""
+    # msg_type comes straight from client JSON and may not be hashable.
+    handler = _WS_HANDLERS.get(msg_type) if isinstance(msg_type, str) else None
+    if handler is None:
+        return {
+            "type": "error",
+            "data": {"message": f"Unknown message type: {msg_type}"},
+        }
+    try:
+        return await handler(container, msg_data)
+    except ValueError as e:
+        # Expected client errors (e.g. unknown NPC) — no traceback to format
+        return {"type": "error", "data": {"message": str(e)}}
     except Exception as e:
         logger.error(f"Error handling {msg_type}: {e}", exc_info=True)
         return {"type": "error", "data": {"message": "Internal server error"}}
@@ -325,14 +427,27 @@ async def handle_app_message(container: ServiceContainer, msg_data: dict) -> dic
     try:
         result = container.app_service.handle_action(app_type, action, msg_data)
         return {"type": "app_response", "data": result}
+    except MissingFieldError as e:
+        logger.warning("App %s/%s: missing field %r", app_type, action, e.field)
+        return {"type": "error", "data": {"message": str(e)}}
     except ValueError as e:
-        # Client errors (unknown action, missing fields) — safe to expose
+        # Client errors (unknown action, invalid values) — safe to expose
         return {"type": "error", "data": {"message": str(e)}}
     except Exception as e:
         logger.error(f"App message error: {e}", exc_info=True)
         return {"type": "error", "data": {"message": "Internal server error"}}
 
 
+# Message type -> handler, built once at import so routing is a single dict
+# lookup rather than an if/elif chain per message.
+_WS_HANDLERS: dict[str, WSHandler] = {
+    "ping": _ws_ping,
+    "get_npcs": _ws_get_npcs,
+    "chat": _ws_chat,
+    "app": handle_app_message,
+}
+
+
 # ============================================================================
 # WebSocket Terminal
 # ============================================================================
@@ -419,13 +534,17 @@ async def _ws_reader(websocket: WebSocket, session) -> None:
             if session.mode == "cooked":
                 line = data.get("line", "")
                 items, replace = session.shell.get_completions_ext(line)
-                await websocket.send_json(
-                    {"type": "completions", "items": items, "replace": replace}
+                await websocket.send_text(
+                    encode_frame(
+                        {"type": "completions", "items": items, "replace": replace}
+                    )
                 )
 
         else:
-            await websocket.send_json(
-                {"type": "error", "message": f"Unknown message type: {msg_type}"}
+            await websocket.send_text(
+                encode_frame(
+                    {"type": "error", "message": f"Unknown message type: {msg_type}"}
+                )
             )
 
 
@@ -433,7 +552,7 @@ async def _ws_writer(websocket: WebSocket, session) -> None:
     """Drain the shell's output queue and send messages to the WebSocket."""
     while True:
         msg = await session.output_queue.get()
-        await websocket.send_json(msg)
+        await websocket.send_text(encode_frame(msg))
 
         if msg["type"] == "exit":
             break
@@ -443,10 +562,16 @@ def main():
     """Entry point for the Recursive://Neon backend server"""
     import uvicorn
 
+    # Pin the fast drivers that ``uvicorn[standard]`` installs instead of
+    # relying on "auto", which silently falls back to asyncio/h11 if they
+    # are missing.  uvloop has no Windows build, so keep asyncio there.
     uvicorn.run(
         "recursive_neon.main:app",
         host=settings.host,
         port=settings.port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
         reload=settings.debug,
         log_level="debug" if settings.debug else "info",
     )
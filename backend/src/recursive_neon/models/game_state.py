@@ -47,10 +47,32 @@ class SystemState(BaseModel):
     uptime_seconds: float = 0
     last_error: str | None = None
 
+    def to_stats_dict(self, uptime_seconds: float | None = None) -> dict[str, Any]:
+        """Return a JSON-ready dict of the current state.
+
+        Hand-built from the attributes so the polled ``/stats`` endpoint
+        skips a full ``model_dump()`` schema walk.  Keep in sync with the
+        fields above.
+
+        Args:
+            uptime_seconds: Live uptime to report instead of the stored value
+        """
+        return {
+            "status": self.status.value,
+            "ollama_running": self.ollama_running,
+            "ollama_models_loaded": list(self.ollama_models_loaded),
+            "npcs_loaded": self.npcs_loaded,
+            "uptime_seconds": self.uptime_seconds
+            if uptime_seconds is None
+            else uptime_seconds,
+            "last_error": self.last_error,
+        }
+
 
 class StatusResponse(BaseModel):
     """Status response for health checks"""
 
     status: str
     system: SystemState
+    started_at: str | None = None  # ISO-8601, pre-formatted by the container
     timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
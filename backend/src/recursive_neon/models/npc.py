@@ -54,6 +54,10 @@ class NPCMemory(BaseModel):
     last_interaction: datetime | None = None
 
 
+# Indexed by (level > 50) + (level >= -50): below -50, -50..50, above 50.
+_RELATIONSHIP_DESC = ("cold and distrustful", "neutral", "friendly and trusting")
+
+
 class NPC(BaseModel):
     """NPC definition"""
 
@@ -121,11 +125,8 @@ class NPC(BaseModel):
             return self.system_prompt_template
 
         # Default system prompt
-        relationship_desc = "neutral"
-        if self.memory.relationship_level > 50:
-            relationship_desc = "friendly and trusting"
-        elif self.memory.relationship_level < -50:
-            relationship_desc = "cold and distrustful"
+        level = self.memory.relationship_level
+        relationship_desc = _RELATIONSHIP_DESC[(level > 50) + (level >= -50)]
 
         recent_facts = (
             "\n".join(f"- {fact}" for fact in self.memory.facts_learned[-5:])
@@ -163,15 +164,16 @@ Rules:
             content: Message content
             max_history: Maximum messages to retain. Defaults to 50.
         """
-        message = ConversationMessage(role=role, content=content)
-        self.memory.conversation_history.append(message)
+        history = self.memory.conversation_history
+        history.append(ConversationMessage(role=role, content=content))
         self.memory.last_interaction = datetime.now(tz=UTC)
 
-        # Keep only last N messages to avoid unbounded growth
-        if len(self.memory.conversation_history) > max_history:
-            self.memory.conversation_history = self.memory.conversation_history[
-                -max_history:
-            ]
+        # Keep only last N messages to avoid unbounded growth.  Trim in
+        # place rather than re-slicing, which copied the whole history on
+        # every message once the cap was reached.
+        excess = len(history) - max_history
+        if excess > 0:
+            del history[:excess]
 
     def get_recent_conversation(self, n: int = 10) -> list[dict[str, str]]:
         """Get recent conversation messages in LLM format"""
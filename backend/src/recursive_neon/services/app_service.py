@@ -7,30 +7,56 @@ Presentation-agnostic — works with CLI, TUI, and GUI interfaces.
 
 import base64
 import contextlib
-import json
 import logging
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 
 from recursive_neon.models.app_models import (
     FileNode,
     FileSystemState,
     Note,
+    NotesState,
     Task,
     TaskList,
+    TasksState,
 )
 from recursive_neon.models.game_state import GameState
+from recursive_neon.services.persistence import write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
+StateT = TypeVar("StateT", bound=BaseModel)
+
+# List serializers for action responses, built once.  One dump_python call
+# over a list is cheaper than a model_dump() per item.
+_note_list = TypeAdapter(list[Note])
+_task_list = TypeAdapter(list[Task])
+_task_list_list = TypeAdapter(list[TaskList])
+_file_node_list = TypeAdapter(list[FileNode])
+
 # Maximum file size (in bytes) loaded from initial_fs into the virtual filesystem.
 MAX_INITIAL_FILE_SIZE = 1_048_576  # 1 MB
 
 # Maximum file content size (in characters) accepted via create/update operations.
 MAX_FILE_CONTENT_SIZE = 1_048_576  # 1 MB
 
+# Maximum number of items returned by a single list action ("get_all").
+MAX_PAGE_SIZE = 500
+
+
+class MissingFieldError(ValueError):
+    """A required field is absent from an app action payload."""
+
+    def __init__(self, field: str):
+        super().__init__(f"Missing field: {field}")
+        self.field = field
+
 
 class AppService:
     """
@@ -56,6 +82,40 @@ class AppService:
         self._children_index: dict[str | None, list[str]] = {}
         self._position_index: dict[str, int] = {}  # node_id → index in nodes list
         self._rebuild_indexes()
+        # note_id → index in game_state.notes.notes
+        self._note_positions: dict[str, int] = {}
+        self._rebuild_note_index()
+        # app_type → action → bound handler, built once so routing an action
+        # is two dict lookups instead of an if/elif chain.
+        self._app_actions: dict[str, dict[str, Callable[[dict], dict]]] = {
+            "filesystem": {
+                "init": self._fs_init,
+                "list": self._fs_list,
+                "get": self._fs_get,
+                "create_file": self._fs_create_file,
+                "create_directory": self._fs_create_directory,
+                "update": self._fs_update,
+                "delete": self._fs_delete,
+                "copy": self._fs_copy,
+                "move": self._fs_move,
+            },
+            "notes": {
+                "get_all": self._notes_get_all,
+                "count": self._notes_count,
+                "create": self._notes_create,
+                "update": self._notes_update,
+                "delete": self._notes_delete,
+            },
+            "tasks": {
+                "get_lists": self._tasks_get_lists,
+                "create_list": self._tasks_create_list,
+                "delete_list": self._tasks_delete_list,
+                "create_task": self._tasks_create_task,
+                "update_task": self._tasks_update_task,
+                "update_tasks": self._tasks_update_tasks,
+                "delete_task": self._tasks_delete_task,
+            },
+        }
 
     def _rebuild_indexes(self) -> None:
         """Rebuild lookup indexes from the canonical nodes list."""
@@ -105,28 +165,35 @@ class AppService:
 
     def handle_action(self, app_type: str, action: str, data: dict) -> dict:
         """Route an app action to the appropriate handler."""
-        handlers = {
-            "filesystem": self._handle_filesystem_action,
-            "notes": self._handle_notes_action,
-            "tasks": self._handle_tasks_action,
-        }
-        handler = handlers.get(app_type)
-        if not handler:
+        actions = self._app_actions.get(app_type)
+        if actions is None:
             raise ValueError(f"Unknown app type: {app_type}")
-        return handler(action, data)
+        handler = actions.get(action)
+        if handler is None:
+            raise ValueError(f"Unknown {app_type} action: {action}")
+        return handler(data)
 
     # ============================================================================
     # Notes
     # ============================================================================
 
+    def _rebuild_note_index(self) -> None:
+        """Rebuild the note position index from the canonical notes list."""
+        self._note_positions = {
+            n.id: i for i, n in enumerate(self.game_state.notes.notes)
+        }
+
+    def _note_position(self, note_id: str) -> int:
+        pos = self._note_positions.get(note_id)
+        if pos is None:
+            raise ValueError(f"Note not found: {note_id}")
+        return pos
+
     def get_notes(self) -> list[Note]:
         return self.game_state.notes.notes
 
     def get_note(self, note_id: str) -> Note:
-        for note in self.game_state.notes.notes:
-            if note.id == note_id:
-                return note
-        raise ValueError(f"Note not found: {note_id}")
+        return self.game_state.notes.notes[self._note_position(note_id)]
 
     def create_note(self, data: dict[str, Any]) -> Note:
         timestamp = datetime.now(tz=UTC)
@@ -138,44 +205,81 @@ class AppService:
             updated_at=timestamp,
         )
         self.game_state.notes.notes.append(note)
+        self._note_positions[note.id] = len(self.game_state.notes.notes) - 1
         return note
 
     def update_note(self, note_id: str, data: dict[str, Any]) -> Note:
-        timestamp = datetime.now(tz=UTC)
-        for i, n in enumerate(self.game_state.notes.notes):
-            if n.id == note_id:
-                updated = Note(
-                    id=n.id,
-                    title=data.get("title", n.title),
-                    content=data.get("content", n.content),
-                    created_at=n.created_at,
-                    updated_at=timestamp,
-                )
-                self.game_state.notes.notes[i] = updated
-                return updated
-        raise ValueError(f"Note not found: {note_id}")
+        pos = self._note_position(note_id)
+        n = self.game_state.notes.notes[pos]
+        updated = Note(
+            id=n.id,
+            title=data.get("title", n.title),
+            content=data.get("content", n.content),
+            created_at=n.created_at,
+            updated_at=datetime.now(tz=UTC),
+        )
+        self.game_state.notes.notes[pos] = updated
+        return updated
 
     def delete_note(self, note_id: str) -> None:
-        original_len = len(self.game_state.notes.notes)
-        self.game_state.notes.notes = [
-            n for n in self.game_state.notes.notes if n.id != note_id
-        ]
-        if len(self.game_state.notes.notes) == original_len:
-            raise ValueError(f"Note not found: {note_id}")
+        pos = self._note_position(note_id)
+        notes = self.game_state.notes.notes
+        # Delete in place and shift only the positions after the gap,
+        # instead of rebuilding the list and the whole index.
+        del notes[pos]
+        del self._note_positions[note_id]
+        for i in range(pos, len(notes)):
+            self._note_positions[notes[i].id] = i
 
-    def _handle_notes_action(self, action: str, data: dict) -> dict:
-        if action == "get_all":
-            return {"notes": [n.model_dump(mode="json") for n in self.get_notes()]}
-        elif action == "create":
-            note = self.create_note(data)
-            return {"note": note.model_dump(mode="json")}
-        elif action == "update":
-            note = self.update_note(data["note_id"], data)
-            return {"note": note.model_dump(mode="json")}
-        elif action == "delete":
-            self.delete_note(data["note_id"])
-            return {"success": True}
-        raise ValueError(f"Unknown notes action: {action}")
+    @staticmethod
+    def _field(data: dict, key: str) -> Any:
+        """Return the required payload field *key* or raise MissingFieldError."""
+        try:
+            return data[key]
+        except KeyError:
+            raise MissingFieldError(key) from None
+
+    @staticmethod
+    def _page_bounds(data: dict) -> slice:
+        """Return the slice selected by *data*'s ``limit``/``offset``.
+
+        ``limit`` is clamped to ``1..MAX_PAGE_SIZE`` (default: the maximum)
+        so a client can't request an unbounded serialisation.  Raises
+        ``ValueError`` if either value is not an integer.
+        """
+        limit = data.get("limit", MAX_PAGE_SIZE)
+        offset = data.get("offset", 0)
+        for value in (limit, offset):
+            # bool is an int subclass; floats, numeric strings and
+            # JSON Infinity are rejected rather than coerced.
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError("limit/offset must be integers")
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        offset = max(offset, 0)
+        return slice(offset, offset + limit)
+
+    def _notes_get_all(self, data: dict) -> dict:
+        notes = self.get_notes()
+        page = notes[self._page_bounds(data)]
+        return {
+            "notes": _note_list.dump_python(page, mode="json"),
+            "total": len(notes),
+        }
+
+    def _notes_count(self, data: dict) -> dict:
+        return {"count": len(self.get_notes())}
+
+    def _notes_create(self, data: dict) -> dict:
+        note = self.create_note(data)
+        return {"note": note.model_dump(mode="json")}
+
+    def _notes_update(self, data: dict) -> dict:
+        note = self.update_note(self._field(data, "note_id"), data)
+        return {"note": note.model_dump(mode="json")}
+
+    def _notes_delete(self, data: dict) -> dict:
+        self.delete_note(self._field(data, "note_id"))
+        return {"success": True}
 
     # ============================================================================
     # Tasks
@@ -247,6 +351,42 @@ class AppService:
                     return updated_task
         raise ValueError(f"Task not found: {task_id}")
 
+    def update_tasks(
+        self, list_id: str, task_ids: list[str], data: dict[str, Any]
+    ) -> list[Task]:
+        """Apply the same update to several tasks in one list.
+
+        The list is rebuilt once, so e.g. "mark all done" costs a single
+        pass instead of one ``update_task`` call (and response) per task.
+        Raises ``ValueError`` if *task_ids* is not a list of strings.
+        """
+        if not isinstance(task_ids, list) or not all(
+            isinstance(t, str) for t in task_ids
+        ):
+            raise ValueError("task_ids must be a list of strings")
+        wanted = set(task_ids)
+        tl = self.get_task_list(list_id)
+        missing = wanted.difference(t.id for t in tl.tasks)
+        if missing:
+            raise ValueError(f"Task not found: {', '.join(sorted(missing))}")
+        updated_tasks = []
+        changed = []
+        for task in tl.tasks:
+            if task.id in wanted:
+                task = Task(
+                    id=task.id,
+                    title=data.get("title", task.title),
+                    completed=data.get("completed", task.completed),
+                    parent_id=data.get("parent_id", task.parent_id),
+                )
+                changed.append(task)
+            updated_tasks.append(task)
+        i = self.game_state.tasks.lists.index(tl)
+        self.game_state.tasks.lists[i] = TaskList(
+            id=tl.id, name=tl.name, tasks=updated_tasks
+        )
+        return changed
+
     def delete_task(self, list_id: str, task_id: str) -> None:
         for i, tl in enumerate(self.game_state.tasks.lists):
             if tl.id == list_id:
@@ -261,27 +401,37 @@ class AppService:
                 return
         raise ValueError(f"Task list not found: {list_id}")
 
-    def _handle_tasks_action(self, action: str, data: dict) -> dict:
-        if action == "get_lists":
-            return {
-                "lists": [tl.model_dump(mode="json") for tl in self.get_task_lists()]
-            }
-        elif action == "create_list":
-            tl = self.create_task_list(data)
-            return {"list": tl.model_dump(mode="json")}
-        elif action == "delete_list":
-            self.delete_task_list(data["list_id"])
-            return {"success": True}
-        elif action == "create_task":
-            task = self.create_task(data["list_id"], data)
-            return {"task": task.model_dump(mode="json")}
-        elif action == "update_task":
-            task = self.update_task(data["list_id"], data["task_id"], data)
-            return {"task": task.model_dump(mode="json")}
-        elif action == "delete_task":
-            self.delete_task(data["list_id"], data["task_id"])
-            return {"success": True}
-        raise ValueError(f"Unknown tasks action: {action}")
+    def _tasks_get_lists(self, data: dict) -> dict:
+        return {
+            "lists": _task_list_list.dump_python(self.get_task_lists(), mode="json")
+        }
+
+    def _tasks_create_list(self, data: dict) -> dict:
+        tl = self.create_task_list(data)
+        return {"list": tl.model_dump(mode="json")}
+
+    def _tasks_delete_list(self, data: dict) -> dict:
+        self.delete_task_list(self._field(data, "list_id"))
+        return {"success": True}
+
+    def _tasks_create_task(self, data: dict) -> dict:
+        task = self.create_task(self._field(data, "list_id"), data)
+        return {"task": task.model_dump(mode="json")}
+
+    def _tasks_update_task(self, data: dict) -> dict:
+        list_id = self._field(data, "list_id")
+        task = self.update_task(list_id, self._field(data, "task_id"), data)
+        return {"task": task.model_dump(mode="json")}
+
+    def _tasks_update_tasks(self, data: dict) -> dict:
+        list_id = self._field(data, "list_id")
+        tasks = self.update_tasks(list_id, self._field(data, "task_ids"), data)
+        return {"tasks": _task_list.dump_python(tasks, mode="json")}
+
+    def _tasks_delete_task(self, data: dict) -> dict:
+        list_id = self._field(data, "list_id")
+        self.delete_task(list_id, self._field(data, "task_id"))
+        return {"success": True}
 
     # ============================================================================
     # Virtual FileSystem
@@ -525,42 +675,52 @@ class AppService:
         """Return a copy of *data* containing only *allowed* keys."""
         return {k: v for k, v in data.items() if k in allowed}
 
-    def _handle_filesystem_action(self, action: str, data: dict) -> dict:
-        if action == "init":
-            root = self.init_filesystem()
-            return {"root": root.model_dump(mode="json")}
-        elif action == "list":
-            nodes = self.list_directory(data["dir_id"])
-            return {"nodes": [n.model_dump(mode="json") for n in nodes]}
-        elif action == "get":
-            node = self.get_file(data["file_id"])
-            return {"node": node.model_dump(mode="json")}
-        elif action == "create_file":
-            safe = self._pick_keys(data, {"name", "parent_id", "content", "mime_type"})
-            node = self.create_file(safe)
-            return {"node": node.model_dump(mode="json")}
-        elif action == "create_directory":
-            safe = self._pick_keys(data, {"name", "parent_id"})
-            node = self.create_directory(safe)
-            return {"node": node.model_dump(mode="json")}
-        elif action == "update":
-            safe = self._pick_keys(data, {"name", "content", "mime_type"})
-            node = self.update_file(data["file_id"], safe)
-            return {"node": node.model_dump(mode="json")}
-        elif action == "delete":
-            self.delete_file(data["file_id"])
-            return {"success": True}
-        elif action == "copy":
-            node = self.copy_file(
-                data["file_id"], data["target_parent_id"], data.get("new_name")
-            )
-            return {"node": node.model_dump(mode="json")}
-        elif action == "move":
-            node = self.move_file(
-                data["file_id"], data["target_parent_id"], data.get("new_name")
-            )
-            return {"node": node.model_dump(mode="json")}
-        raise ValueError(f"Unknown filesystem action: {action}")
+    def _fs_init(self, data: dict) -> dict:
+        root = self.init_filesystem()
+        return {"root": root.model_dump(mode="json")}
+
+    def _fs_list(self, data: dict) -> dict:
+        nodes = self.list_directory(self._field(data, "dir_id"))
+        return {"nodes": _file_node_list.dump_python(nodes, mode="json")}
+
+    def _fs_get(self, data: dict) -> dict:
+        node = self.get_file(self._field(data, "file_id"))
+        return {"node": node.model_dump(mode="json")}
+
+    def _fs_create_file(self, data: dict) -> dict:
+        safe = self._pick_keys(data, {"name", "parent_id", "content", "mime_type"})
+        node = self.create_file(safe)
+        return {"node": node.model_dump(mode="json")}
+
+    def _fs_create_directory(self, data: dict) -> dict:
+        safe = self._pick_keys(data, {"name", "parent_id"})
+        node = self.create_directory(safe)
+        return {"node": node.model_dump(mode="json")}
+
+    def _fs_update(self, data: dict) -> dict:
+        safe = self._pick_keys(data, {"name", "content", "mime_type"})
+        node = self.update_file(self._field(data, "file_id"), safe)
+        return {"node": node.model_dump(mode="json")}
+
+    def _fs_delete(self, data: dict) -> dict:
+        self.delete_file(self._field(data, "file_id"))
+        return {"success": True}
+
+    def _fs_copy(self, data: dict) -> dict:
+        node = self.copy_file(
+            self._field(data, "file_id"),
+            self._field(data, "target_parent_id"),
+            data.get("new_name"),
+        )
+        return {"node": node.model_dump(mode="json")}
+
+    def _fs_move(self, data: dict) -> dict:
+        node = self.move_file(
+            self._field(data, "file_id"),
+            self._field(data, "target_parent_id"),
+            data.get("new_name"),
+        )
+        return {"node": node.model_dump(mode="json")}
 
     # ============================================================================
     # Persistence
@@ -568,23 +728,29 @@ class AppService:
 
     @staticmethod
     def _save_json(data_dir: str, filename: str, data: dict) -> None:
-        """Write a dict to a JSON file in data_dir."""
+        """Write a dict to a JSON file in data_dir.
+
+        *data* may contain Pydantic models; pydantic-core serializes them
+        directly, with the same output as ``model_dump(mode="json")`` run
+        through ``json.dump(indent=2, ensure_ascii=False)``.
+        """
         Path(data_dir).mkdir(parents=True, exist_ok=True)
-        filepath = Path(data_dir) / filename
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_bytes_atomic(Path(data_dir) / filename, to_json(data, indent=2))
 
     @staticmethod
-    def _load_json(data_dir: str, filename: str) -> dict | None:
-        """Read a JSON file from data_dir. Returns None if missing or corrupt."""
+    def _load_state(data_dir: str, filename: str, model: type[StateT]) -> StateT | None:
+        """Validate a JSON file in data_dir straight into *model*.
+
+        Parsing and validation happen in one pydantic-core pass over the raw
+        bytes, without building an intermediate dict.  Returns None if the
+        file is missing, unreadable, or invalid.
+        """
         filepath = Path(data_dir) / filename
         if not filepath.exists():
             return None
         try:
-            with open(filepath, encoding="utf-8") as f:
-                result: dict = json.load(f)
-                return result
-        except (json.JSONDecodeError, OSError) as e:
+            return model.model_validate_json(filepath.read_bytes())
+        except (ValueError, OSError) as e:
             logger.warning("Failed to load %s: %s", filepath, e)
             return None
 
@@ -593,80 +759,54 @@ class AppService:
             data_dir,
             "filesystem.json",
             {
-                "nodes": [
-                    node.model_dump(mode="json")
-                    for node in self.game_state.filesystem.nodes
-                ],
+                "nodes": self.game_state.filesystem.nodes,
                 "root_id": self.game_state.filesystem.root_id,
             },
         )
 
     def load_filesystem_from_disk(self, data_dir: str = "backend/game_data") -> bool:
-        data = self._load_json(data_dir, "filesystem.json")
-        if data is None:
+        state = self._load_state(data_dir, "filesystem.json", FileSystemState)
+        if state is None:
             return False
-        try:
-            self.game_state.filesystem = FileSystemState(
-                nodes=[FileNode(**node) for node in data["nodes"]],
-                root_id=data.get("root_id"),
-            )
-            self._rebuild_indexes()
-            return True
-        except (KeyError, TypeError, ValueError) as e:
-            logger.warning("Corrupt filesystem.json: %s", e)
+        if "nodes" not in state.model_fields_set:
+            logger.warning("Corrupt filesystem.json: missing 'nodes'")
             return False
+        self.game_state.filesystem = state
+        self._rebuild_indexes()
+        return True
 
     def save_notes_to_disk(self, data_dir: str = "backend/game_data") -> None:
         self._save_json(
             data_dir,
             "notes.json",
             {
-                "notes": [
-                    note.model_dump(mode="json") for note in self.game_state.notes.notes
-                ],
+                "notes": self.game_state.notes.notes,
             },
         )
 
     def load_notes_from_disk(self, data_dir: str = "backend/game_data") -> bool:
-        data = self._load_json(data_dir, "notes.json")
-        if data is None:
-            return False
-        try:
-            from recursive_neon.models.app_models import NotesState
-
-            self.game_state.notes = NotesState(
-                notes=[Note(**n) for n in data.get("notes", [])],
-            )
-            return True
-        except (KeyError, TypeError, ValueError) as e:
-            logger.warning("Corrupt notes.json: %s", e)
+        state = self._load_state(data_dir, "notes.json", NotesState)
+        if state is None:
             return False
+        self.game_state.notes = state
+        self._rebuild_note_index()
+        return True
 
     def save_tasks_to_disk(self, data_dir: str = "backend/game_data") -> None:
         self._save_json(
             data_dir,
             "tasks.json",
             {
-                "lists": [
-                    tl.model_dump(mode="json") for tl in self.game_state.tasks.lists
-                ],
+                "lists": self.game_state.tasks.lists,
             },
         )
 
     def load_tasks_from_disk(self, data_dir: str = "backend/game_data") -> bool:
-        data = self._load_json(data_dir, "tasks.json")
-        if data is None:
-            return False
-        try:
-            from recursive_neon.models.app_models import TasksState
-
-            self.game_state.tasks = TasksState(
-                lists=[TaskList(**tl) for tl in data.get("lists", [])],
-            )
-            return True
-        except (KeyError, TypeError, ValueError) as e:
-            logger.warning("Corrupt tasks.json: %s", e)
+        state = self._load_state(data_dir, "tasks.json", TasksState)
+        if state is None:
             return False
+        self.game_state.tasks = state
+        return True
 
     def save_all_to_disk(self, data_dir: str = "backend/game_data") -> None:
         """Save all state (filesystem, notes, tasks) to disk."""
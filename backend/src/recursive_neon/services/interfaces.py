@@ -19,6 +19,9 @@ from recursive_neon.models.npc import NPC, ChatResponse
 # ============================================================================
 
 
+# Deliberately not @runtime_checkable: the LLM is injected once into
+# NPCManager and then held as an attribute, so a structural isinstance()
+# check would add cost on every call without adding any safety.
 class LLMInterface(Protocol):
     """
     Protocol for Language Model providers.
@@ -44,6 +47,8 @@ class LLMInterface(Protocol):
 class INPCManager(ABC):
     """Abstract interface for NPC management."""
 
+    __slots__ = ()
+
     @abstractmethod
     def register_npc(self, npc: NPC) -> None:
         """Register a new NPC."""
@@ -100,6 +105,8 @@ class INPCManager(ABC):
 class IOllamaClient(ABC):
     """Abstract interface for Ollama HTTP client."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def health_check(self) -> bool:
         """Check if Ollama server is healthy."""
@@ -117,6 +124,11 @@ class IOllamaClient(ABC):
         """List available models on the Ollama server."""
         pass
 
+    @abstractmethod
+    async def preload_model(self, model: str, keep_alive: str = "30m") -> bool:
+        """Load a model into memory ahead of the first request."""
+        pass
+
     @abstractmethod
     async def generate(
         self,
@@ -150,6 +162,8 @@ class IOllamaClient(ABC):
 class IProcessManager(ABC):
     """Abstract interface for Ollama process management."""
 
+    __slots__ = ()
+
     @abstractmethod
     async def start(self) -> bool:
         """Start the Ollama server process."""
@@ -6,7 +6,6 @@ The NPCManager now accepts an LLM instance via constructor injection.
 """
 
 import asyncio
-import json
 import logging
 import re
 from pathlib import Path
@@ -14,16 +13,29 @@ from typing import Any, Callable
 
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_ollama import ChatOllama
+from pydantic import BaseModel, Field
+from pydantic_core import to_json
 
 from recursive_neon.config import settings
 from recursive_neon.models.npc import NPC, ChatResponse, NPCPersonality, NPCRole
 from recursive_neon.services.interfaces import INPCManager, LLMInterface
+from recursive_neon.services.persistence import write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
 # Regex to strip <think>...</think> blocks emitted by some models (e.g. qwen3).
 _THINK_TAG_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
 
+# Substrings that nudge an NPC's relationship level up or down after a chat.
+_POSITIVE_WORDS = ("thank", "please", "appreciate")
+_NEGATIVE_WORDS = ("stupid", "hate", "idiot")
+
+
+class _NPCFile(BaseModel):
+    """Layout of npcs.json."""
+
+    npcs: list[NPC] = Field(default_factory=list)
+
 
 def _strip_think_tags(text: str) -> str:
     """Remove <think>...</think> blocks from model output."""
@@ -204,13 +216,12 @@ class NPCManager(INPCManager):
             npc.add_to_memory("assistant", cleaned, max_history=max_hist)
 
             # Update relationship based on sentiment (simple heuristic)
-            if any(
-                word in message.lower() for word in ["thank", "please", "appreciate"]
-            ):
+            lowered = message.lower()
+            if any(word in lowered for word in _POSITIVE_WORDS):
                 npc.memory.relationship_level = min(
                     100, npc.memory.relationship_level + 1
                 )
-            elif any(word in message.lower() for word in ["stupid", "hate", "idiot"]):
+            elif any(word in lowered for word in _NEGATIVE_WORDS):
                 npc.memory.relationship_level = max(
                     -100, npc.memory.relationship_level - 5
                 )
@@ -356,9 +367,10 @@ class NPCManager(INPCManager):
         """Save NPC state (definitions + memory) to disk."""
         Path(data_dir).mkdir(parents=True, exist_ok=True)
         filepath = Path(data_dir) / "npcs.json"
-        npcs_data = [npc.model_dump(mode="json") for npc in self.npcs.values()]
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump({"npcs": npcs_data}, f, indent=2, ensure_ascii=False)
+        # pydantic-core serializes the models straight to JSON bytes.
+        write_bytes_atomic(
+            filepath, to_json({"npcs": list(self.npcs.values())}, indent=2)
+        )
 
     def load_npcs_from_disk(self, data_dir: str = "backend/game_data") -> bool:
         """Load NPC state from disk. Returns False if missing or corrupt."""
@@ -366,13 +378,12 @@ class NPCManager(INPCManager):
         if not filepath.exists():
             return False
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
-            for npc_data in data.get("npcs", []):
-                npc = NPC(**npc_data)
+            # Parse and validate the raw bytes in one pydantic-core pass.
+            data = _NPCFile.model_validate_json(filepath.read_bytes())
+            for npc in data.npcs:
                 self.register_npc(npc)
             logger.info(f"Loaded {len(self.npcs)} NPCs from disk")
             return True
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError, OSError) as e:
+        except (KeyError, TypeError, ValueError, OSError) as e:
             logger.warning("Failed to load NPCs from %s: %s", filepath, e)
             return False
@@ -16,8 +16,13 @@ from recursive_neon.services.interfaces import IOllamaClient
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for talking to the local ollama server.  Shared with
+# the ChatOllama instance built in ServiceFactory so both pools keep the same
+# number of warm connections.
+OLLAMA_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GenerationResponse:
     """Response from ollama generation"""
 
@@ -47,10 +52,23 @@ class OllamaClient(IOllamaClient):
     - Error handling and retries
     """
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 11434, timeout: int = 60):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 11434,
+        timeout: int = 60,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = f"http://{host}:{port}"
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # An injected client may be shared with other consumers, so only a
+        # client created here is closed by close().
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=self.base_url, timeout=timeout, limits=OLLAMA_HTTP_LIMITS
+            )
+        self.client = client
 
     async def health_check(self) -> bool:
         """Check if ollama server is responding"""
@@ -96,6 +114,27 @@ class OllamaClient(IOllamaClient):
             logger.error(f"Failed to list models: {e}")
             return []
 
+    async def preload_model(self, model: str, keep_alive: str = "30m") -> bool:
+        """
+        Load a model into memory so the first chat doesn't pay the load time
+
+        Ollama loads a model when it receives a generate request without a
+        prompt; ``keep_alive`` controls how long it stays resident.
+
+        Returns:
+            True if the model was loaded, False on any error
+        """
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/api/generate",
+                json={"model": model, "keep_alive": keep_alive},
+            )
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to preload model {model}: {e}")
+            return False
+
     async def generate(
         self,
         prompt: str,
@@ -229,8 +268,9 @@ class OllamaClient(IOllamaClient):
             raise
 
     async def close(self):
-        """Close the HTTP client"""
-        await self.client.aclose()
+        """Close the HTTP client if this instance created it"""
+        if self._owns_client:
+            await self.client.aclose()
 
     async def __aenter__(self) -> "OllamaClient":
         return self
@@ -0,0 +1,24 @@
+"""
+Persistence helpers shared by the services that save game state to disk.
+"""
+
+import contextlib
+import os
+from pathlib import Path
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* so that a crash never leaves a truncated file.
+
+    The bytes go to ``<name>.tmp`` next to *path*, which is then renamed over
+    it with ``os.replace``.  If either step fails, the temp file is removed
+    and the previous contents of *path* are left untouched.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
@@ -56,6 +56,140 @@ class TestNotesService:
             app_service.get_note(note.id)
 
 
+class TestNotesIndex:
+    """Tests for the note id → position index"""
+
+    @pytest.fixture
+    def app_service(self):
+        return AppService(GameState())
+
+    def test_lookups_after_delete(self, app_service):
+        notes = [app_service.create_note({"title": f"N{i}"}) for i in range(4)]
+        app_service.delete_note(notes[1].id)
+        assert app_service.get_note(notes[2].id).title == "N2"
+        updated = app_service.update_note(notes[3].id, {"title": "Last"})
+        assert app_service.get_notes()[-1] is updated
+        with pytest.raises(ValueError):
+            app_service.update_note(notes[1].id, {"title": "Gone"})
+
+    def test_delete_is_in_place(self, app_service):
+        notes = [app_service.create_note({"title": f"N{i}"}) for i in range(3)]
+        stored = app_service.get_notes()
+        app_service.delete_note(notes[0].id)
+        assert app_service.get_notes() is stored
+        assert [n.title for n in stored] == ["N1", "N2"]
+        with pytest.raises(ValueError):
+            app_service.delete_note(notes[0].id)
+
+    def test_index_rebuilt_on_load(self, app_service, tmp_path):
+        note = app_service.create_note({"title": "Saved"})
+        app_service.save_notes_to_disk(str(tmp_path))
+
+        fresh = AppService(GameState())
+        fresh.create_note({"title": "Discarded"})
+        assert fresh.load_notes_from_disk(str(tmp_path)) is True
+        assert fresh.get_note(note.id).title == "Saved"
+
+    def test_index_built_from_existing_state(self, app_service):
+        note = app_service.create_note({"title": "Existing"})
+        shared = AppService(app_service.game_state)
+        assert shared.get_note(note.id) is note
+
+
+class TestNotesPagination:
+    """Tests for limit/offset on the notes get_all action"""
+
+    @pytest.fixture
+    def app_service(self):
+        service = AppService(GameState())
+        for i in range(5):
+            service.create_note({"title": f"Note {i}"})
+        return service
+
+    def test_get_all_defaults_to_one_capped_page(self, app_service):
+        result = app_service.handle_action("notes", "get_all", {})
+        assert len(result["notes"]) == 5
+        assert result["total"] == 5
+
+    def test_get_all_default_page_is_capped(self):
+        from recursive_neon.services.app_service import MAX_PAGE_SIZE
+
+        service = AppService(GameState())
+        for i in range(MAX_PAGE_SIZE + 20):
+            service.create_note({"title": f"Note {i}"})
+        result = service.handle_action("notes", "get_all", {})
+        assert len(result["notes"]) == MAX_PAGE_SIZE
+        assert result["total"] == MAX_PAGE_SIZE + 20
+        rest = service.handle_action("notes", "get_all", {"offset": MAX_PAGE_SIZE})
+        assert len(rest["notes"]) == 20
+
+    @pytest.mark.parametrize(
+        "bad",
+        [
+            {"limit": None},
+            {"offset": [1]},
+            {"limit": "x"},
+            {"limit": "10"},
+            {"limit": 2.9},
+            {"offset": float("inf")},
+            {"limit": float("-inf")},
+            {"limit": True},
+        ],
+    )
+    def test_get_all_rejects_non_integer_bounds(self, app_service, bad):
+        with pytest.raises(ValueError, match="limit/offset must be integers"):
+            app_service.handle_action("notes", "get_all", bad)
+
+    def test_get_all_limit_and_offset(self, app_service):
+        result = app_service.handle_action(
+            "notes", "get_all", {"limit": 2, "offset": 1}
+        )
+        assert [n["title"] for n in result["notes"]] == ["Note 1", "Note 2"]
+        assert result["total"] == 5
+
+    def test_count_returns_no_items(self, app_service):
+        result = app_service.handle_action("notes", "count", {})
+        assert result == {"count": 5}
+
+    def test_get_all_clamps_limit(self, app_service, monkeypatch):
+        from recursive_neon.services import app_service as module
+
+        monkeypatch.setattr(module, "MAX_PAGE_SIZE", 3)
+        result = app_service.handle_action(
+            "notes", "get_all", {"limit": 10_000_000, "offset": -4}
+        )
+        assert [n["title"] for n in result["notes"]] == [
+            "Note 0",
+            "Note 1",
+            "Note 2",
+        ]
+
+
+class TestActionRouting:
+    """Tests for handle_action dispatch"""
+
+    @pytest.fixture
+    def app_service(self):
+        return AppService(GameState())
+
+    def test_unknown_app_type(self, app_service):
+        with pytest.raises(ValueError, match="Unknown app type: calendar"):
+            app_service.handle_action("calendar", "get_all", {})
+
+    @pytest.mark.parametrize("app_type", ["filesystem", "notes", "tasks"])
+    def test_unknown_action(self, app_service, app_type):
+        with pytest.raises(ValueError, match=f"Unknown {app_type} action: bogus"):
+            app_service.handle_action(app_type, "bogus", {})
+
+    def test_routes_to_each_app(self, app_service):
+        created = app_service.handle_action("notes", "create", {"title": "Hi"})
+        assert created["note"]["title"] == "Hi"
+        lists = app_service.handle_action("tasks", "get_lists", {})
+        assert lists == {"lists": []}
+        root = app_service.handle_action("filesystem", "init", {})["root"]
+        assert root["type"] == "directory"
+
+
 class TestTasksService:
     """Tests for tasks service"""
 
@@ -107,6 +241,46 @@ class TestTasksService:
         updated = app_service.update_task(task_list.id, task.id, {"completed": True})
         assert updated.completed is True
 
+    def test_update_tasks_bulk(self, app_service):
+        """Test applying one update to several tasks at once"""
+        task_list = app_service.create_task_list({"name": "Work"})
+        tasks = [
+            app_service.create_task(task_list.id, {"title": f"T{i}"}) for i in range(3)
+        ]
+        result = app_service.handle_action(
+            "tasks",
+            "update_tasks",
+            {
+                "list_id": task_list.id,
+                "task_ids": [tasks[0].id, tasks[2].id],
+                "completed": True,
+            },
+        )
+        assert [t["title"] for t in result["tasks"]] == ["T0", "T2"]
+        stored = app_service.get_task_list(task_list.id).tasks
+        assert [t.completed for t in stored] == [True, False, True]
+
+    def test_update_tasks_unknown_id_changes_nothing(self, app_service):
+        """Test that a bulk update with a missing task is rejected whole"""
+        task_list = app_service.create_task_list({"name": "Work"})
+        task = app_service.create_task(task_list.id, {"title": "T"})
+        with pytest.raises(ValueError, match="missing"):
+            app_service.update_tasks(
+                task_list.id, [task.id, "missing"], {"completed": True}
+            )
+        assert app_service.get_task_list(task_list.id).tasks[0].completed is False
+
+    @pytest.mark.parametrize("bad", ["abc", None, 42, [1, 2], {"a": 1}])
+    def test_update_tasks_rejects_non_list_ids(self, app_service, bad):
+        """Test that task_ids must be a list of strings"""
+        task_list = app_service.create_task_list({"name": "Work"})
+        with pytest.raises(ValueError, match="task_ids must be a list of strings"):
+            app_service.handle_action(
+                "tasks",
+                "update_tasks",
+                {"list_id": task_list.id, "task_ids": bad, "completed": True},
+            )
+
     def test_delete_task_list(self, app_service):
         """Test deleting a task list"""
         task_list = app_service.create_task_list({"name": "Delete Me"})
@@ -149,6 +323,36 @@ class TestNotesPersistence:
         assert fresh.load_notes_from_disk(str(tmp_path)) is True
         assert fresh.get_notes() == []
 
+    def test_saved_notes_file_format(self, app_service, tmp_path):
+        """The file is the indented, non-ASCII-escaped dump of the models."""
+        import json
+
+        app_service.create_note({"title": "Café", "content": "naïve"})
+        app_service.save_notes_to_disk(str(tmp_path))
+        expected = json.dumps(
+            {"notes": [n.model_dump(mode="json") for n in app_service.get_notes()]},
+            indent=2,
+            ensure_ascii=False,
+        )
+        assert (tmp_path / "notes.json").read_text(encoding="utf-8") == expected
+
+    def test_save_replaces_file_atomically(self, app_service, tmp_path, monkeypatch):
+        """A failed rename keeps the previous save and cleans up the temp file."""
+        app_service.create_note({"title": "First"})
+        app_service.save_notes_to_disk(str(tmp_path))
+        before = (tmp_path / "notes.json").read_bytes()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["notes.json"]
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("recursive_neon.services.persistence.os.replace", fail)
+        app_service.create_note({"title": "Second"})
+        with pytest.raises(OSError):
+            app_service.save_notes_to_disk(str(tmp_path))
+        assert (tmp_path / "notes.json").read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["notes.json"]
+
     def test_load_corrupt_notes_json(self, app_service, tmp_path):
         """Corrupt JSON returns False without crashing."""
         (tmp_path / "notes.json").write_text("{invalid json", encoding="utf-8")
@@ -221,6 +425,16 @@ class TestFileSystemService:
         app_service.init_filesystem()
         assert app_service.game_state.filesystem.root_id is not None
 
+    def test_list_action_matches_model_dump(self, app_service):
+        """Test the list action serializes nodes like model_dump"""
+        root = app_service.init_filesystem()
+        app_service.create_directory({"name": "Documents", "parent_id": root.id})
+        app_service.create_file({"name": "a.txt", "parent_id": root.id})
+        result = app_service.handle_action("filesystem", "list", {"dir_id": root.id})
+        assert result["nodes"] == [
+            n.model_dump(mode="json") for n in app_service.list_directory(root.id)
+        ]
+
     def test_create_directory(self, app_service):
         """Test creating a directory"""
         app_service.init_filesystem()
@@ -460,6 +674,16 @@ class TestFilesystemIndexConsistency:
         for node in fresh.game_state.filesystem.nodes:
             assert fresh._node_index[node.id] is node
 
+    def test_load_filesystem_rejects_invalid_file(self, tmp_path):
+        fresh = AppService(GameState())
+        (tmp_path / "filesystem.json").write_text('{"root_id": null}')
+        assert fresh.load_filesystem_from_disk(str(tmp_path)) is False
+        (tmp_path / "filesystem.json").write_text(
+            '{"nodes": [{"id": "x", "name": "x", "type": "socket"}]}'
+        )
+        assert fresh.load_filesystem_from_disk(str(tmp_path)) is False
+        assert fresh.game_state.filesystem.nodes == []
+
 
 class TestParentIdValidation:
     """Tests for parent_id validation in create_file/create_directory (fix #7)."""
@@ -4,6 +4,8 @@ Tests for the FastAPI application — HTTP endpoints and WebSocket handling.
 Covers the biggest coverage gap identified in the code review (main.py was at 0%).
 """
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -45,11 +47,13 @@ def container(mock_llm):
 def client(container):
     """A FastAPI TestClient with initialized container."""
     initialize_container(container)
+    app.state.services = container
     c = TestClient(app, raise_server_exceptions=False)
     try:
         yield c
     finally:
         c.close()
+        del app.state.services
 
 
 # ============================================================================
@@ -75,6 +79,22 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert data["system"]["status"] == "ready"
 
+    def test_health_reports_preformatted_start_time(self, client, container):
+        resp = client.get("/health")
+        assert resp.json()["started_at"] == container.start_time.isoformat()
+
+    def test_health_does_not_mutate_system_state(self, client, container):
+        container.start_monotonic -= 5
+        resp = client.get("/health")
+        assert resp.json()["system"]["uptime_seconds"] >= 5
+        assert container.system_state.uptime_seconds == 0
+
+    def test_uptime_counts_from_given_start_time(self):
+        container = ServiceFactory.create_test_container(
+            mock_start_time=datetime.now(tz=UTC) - timedelta(minutes=1)
+        )
+        assert 60 <= container.uptime_seconds() < 70
+
     def test_health_unhealthy(self, client, container):
         container.system_state.status = SystemStatus.ERROR
         resp = client.get("/health")
@@ -95,6 +115,16 @@ class TestNPCEndpoints:
         data = resp.json()
         assert data["name"] == "Aria"
 
+    def test_get_npc_matches_model_dump(self, client, container):
+        resp = client.get("/npcs/receptionist_aria")
+        npc = container.npc_manager.get_npc("receptionist_aria")
+        assert resp.json() == npc.model_dump(mode="json")
+
+    def test_app_keeps_default_response_class(self):
+        from fastapi.datastructures import DefaultPlaceholder
+
+        assert isinstance(app.router.default_response_class, DefaultPlaceholder)
+
     def test_get_npc_not_found(self, client):
         resp = client.get("/npcs/nonexistent")
         assert resp.status_code == 404
@@ -138,6 +168,22 @@ class TestStatsEndpoint:
         assert "system" in data
         assert "npc_manager" in data
         assert data["npc_manager"]["total_npcs"] == 5
+        assert data["websocket"]["max_connections"] > 0
+
+    def test_stats_system_matches_model_dump(self, client, container):
+        container.system_state.ollama_models_loaded = ["qwen3:4b"]
+        container.system_state.last_error = "boom"
+        container.start_monotonic -= 5
+        resp = client.get("/stats")
+        system = resp.json()["system"]
+        assert system.pop("uptime_seconds") >= 5
+        assert system == container.system_state.model_dump(
+            mode="json", exclude={"uptime_seconds"}
+        )
+
+    def test_stats_started_at(self, client, container):
+        resp = client.get("/stats")
+        assert resp.json()["started_at"] == container.start_time_iso
 
 
 # ============================================================================
@@ -161,6 +207,13 @@ class TestHandleWsMessage:
         assert resp["type"] == "npcs_list"
         assert len(resp["data"]["npcs"]) == 5
 
+    async def test_get_npcs_matches_model_dump(self, ws_container):
+        resp = await handle_ws_message(ws_container, "get_npcs", {})
+        expected = [
+            npc.model_dump(mode="json") for npc in ws_container.npc_manager.list_npcs()
+        ]
+        assert resp["data"]["npcs"] == expected
+
     async def test_chat_message(self, ws_container, mock_llm):
         from langchain_core.messages import AIMessage
 
@@ -175,11 +228,23 @@ class TestHandleWsMessage:
         assert resp["type"] == "chat_response"
         assert resp["data"]["npc_name"] == "Aria"
 
+    async def test_chat_unknown_npc_is_client_error(self, ws_container, caplog):
+        resp = await handle_ws_message(
+            ws_container, "chat", {"npc_id": "nobody", "message": "Hello"}
+        )
+        assert resp == {"type": "error", "data": {"message": "NPC not found: nobody"}}
+        assert not any(r.exc_info for r in caplog.records)
+
     async def test_unknown_type(self, ws_container):
         resp = await handle_ws_message(ws_container, "bogus", {})
         assert resp["type"] == "error"
         assert "Unknown message type" in resp["data"]["message"]
 
+    async def test_unhashable_type(self, ws_container):
+        resp = await handle_ws_message(ws_container, ["ping"], {})  # type: ignore[arg-type]
+        assert resp["type"] == "error"
+        assert "Unknown message type" in resp["data"]["message"]
+
     async def test_app_filesystem_init(self, ws_container):
         resp = await handle_ws_message(
             ws_container,
@@ -198,6 +263,30 @@ class TestHandleWsMessage:
         assert resp["type"] == "app_response"
         assert "notes" in resp["data"]
 
+    async def test_app_missing_field_is_client_error(self, ws_container, caplog):
+        resp = await handle_ws_message(
+            ws_container, "app", {"app_type": "notes", "action": "delete"}
+        )
+        assert resp == {"type": "error", "data": {"message": "Missing field: note_id"}}
+        assert not any(r.exc_info for r in caplog.records)
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert any("notes/delete" in r.getMessage() for r in warnings)
+        assert any("note_id" in r.getMessage() for r in warnings)
+
+    async def test_app_internal_key_error_is_server_error(
+        self, ws_container, monkeypatch
+    ):
+        def broken(file_id):
+            raise KeyError(file_id)
+
+        monkeypatch.setattr(ws_container.app_service, "get_file", broken)
+        resp = await handle_ws_message(
+            ws_container,
+            "app",
+            {"app_type": "filesystem", "action": "get", "file_id": "abc"},
+        )
+        assert resp == {"type": "error", "data": {"message": "Internal server error"}}
+
     async def test_app_unknown_type(self, ws_container):
         resp = await handle_ws_message(
             ws_container,
@@ -219,6 +308,12 @@ class TestWebSocket:
             resp = ws.receive_json()
             assert resp["type"] == "pong"
 
+    async def test_pong_frame_matches_ping_handler(self, container):
+        from recursive_neon.main import _PONG_FRAME, encode_frame
+
+        resp = await handle_ws_message(container, "ping", {})
+        assert _PONG_FRAME == encode_frame(resp)
+
     def test_websocket_get_npcs(self, client):
         with client.websocket_connect("/ws") as ws:
             ws.send_json({"type": "get_npcs", "data": {}})
@@ -226,6 +321,38 @@ class TestWebSocket:
             assert resp["type"] == "npcs_list"
             assert len(resp["data"]["npcs"]) == 5
 
+    def test_websocket_released_after_close(self, client):
+        from recursive_neon.main import ws_manager
+
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "ping", "data": {}})
+            ws.receive_json()
+        assert not ws_manager.active_connections
+
+    def test_websocket_released_after_error(self, client):
+        from starlette.websockets import WebSocketDisconnect
+
+        from recursive_neon.main import ws_manager
+
+        with client.websocket_connect("/ws") as ws:
+            ws.send_text("not json")
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                ws.receive_json()
+        assert exc_info.value.code == 1011
+        assert not ws_manager.active_connections
+
+    def test_websocket_without_services_takes_no_slot(self):
+        from recursive_neon.main import ws_manager
+
+        assert not hasattr(app.state, "services")
+        c = TestClient(app, raise_server_exceptions=False)
+        try:
+            with pytest.raises(AttributeError), c.websocket_connect("/ws"):
+                pass
+        finally:
+            c.close()
+        assert not ws_manager.active_connections
+
 
 # ============================================================================
 # Lifespan / NPC persistence regression test
@@ -259,6 +386,39 @@ class TestConnectionManager:
         mgr.disconnect(ws)  # Should not raise
         assert len(mgr.active_connections) == 0
 
+    async def test_connect_rejects_over_limit(self):
+        from unittest.mock import AsyncMock
+
+        from recursive_neon.main import ConnectionManager
+
+        mgr = ConnectionManager(max_connections=1)
+        first, second = AsyncMock(), AsyncMock()
+        assert await mgr.connect(first)
+        assert not await mgr.connect(second)
+        second.close.assert_called_once_with(code=1013, reason="Server overloaded")
+        second.accept.assert_not_called()
+        assert mgr.get_stats() == {
+            "active_connections": 1,
+            "max_connections": 1,
+            "rejected_connections": 1,
+        }
+
+    async def test_send_personal_sends_compact_text_frame(self):
+        from unittest.mock import AsyncMock
+
+        from recursive_neon.main import ConnectionManager
+
+        mgr = ConnectionManager()
+        ws = AsyncMock()
+        await mgr.send_personal({"type": "pong", "data": {"text": "né"}}, ws)
+        ws.send_text.assert_called_once_with('{"type":"pong","data":{"text":"né"}}')
+
+    def test_encode_frame_serializes_datetimes(self):
+        from recursive_neon.main import encode_frame
+
+        stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert encode_frame({"at": stamp}) == '{"at":"2025-01-02T03:04:05Z"}'
+
     async def test_broadcast_handles_failing_client(self):
         """If one client errors during broadcast, others still receive."""
         from unittest.mock import AsyncMock
@@ -268,13 +428,121 @@ class TestConnectionManager:
         mgr = ConnectionManager()
         good_ws = AsyncMock()
         bad_ws = AsyncMock()
-        bad_ws.send_json.side_effect = Exception("disconnected")
+        bad_ws.send_text.side_effect = Exception("disconnected")
 
         mgr.active_connections.add(good_ws)
         mgr.active_connections.add(bad_ws)
 
         await mgr.broadcast({"type": "test"})
-        good_ws.send_json.assert_called_once_with({"type": "test"})
+        good_ws.send_text.assert_called_once_with('{"type":"test"}')
+
+    async def test_broadcast_reaps_failed_clients(self):
+        from unittest.mock import AsyncMock
+
+        from recursive_neon.main import ConnectionManager
+
+        mgr = ConnectionManager()
+        good_ws = AsyncMock()
+        bad_ws = AsyncMock()
+        bad_ws.send_text.side_effect = Exception("disconnected")
+        mgr.active_connections.update([good_ws, bad_ws])
+
+        await mgr.broadcast({"type": "test"})
+        assert mgr.active_connections == {good_ws}
+
+        await mgr.broadcast({"type": "again"})
+        assert bad_ws.send_text.call_count == 1
+
+    async def test_broadcast_sends_concurrently(self):
+        """A slow client doesn't hold up delivery to the others."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from recursive_neon.main import ConnectionManager
+
+        release = asyncio.Event()
+        fast_sent = asyncio.Event()
+
+        async def slow_send(frame):
+            await release.wait()
+
+        async def fast_send(frame):
+            fast_sent.set()
+
+        mgr = ConnectionManager()
+        slow_ws = AsyncMock()
+        slow_ws.send_text.side_effect = slow_send
+        fast_ws = AsyncMock()
+        fast_ws.send_text.side_effect = fast_send
+        mgr.active_connections.update([slow_ws, fast_ws])
+
+        task = asyncio.create_task(mgr.broadcast({"type": "test"}))
+        await asyncio.wait_for(fast_sent.wait(), timeout=1)
+        assert not task.done()
+        release.set()
+        await task
+
+    async def test_broadcast_encodes_once(self, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        from recursive_neon import main
+
+        calls = []
+        real_encode = main.encode_frame
+        monkeypatch.setattr(
+            main, "encode_frame", lambda m: calls.append(m) or real_encode(m)
+        )
+
+        mgr = main.ConnectionManager()
+        clients = [AsyncMock() for _ in range(3)]
+        mgr.active_connections.update(clients)
+
+        await mgr.broadcast({"type": "test"})
+        assert len(calls) == 1
+        for ws in clients:
+            ws.send_text.assert_called_once_with('{"type":"test"}')
+
+
+class TestContainerResolution:
+    """Endpoints read the container from ``app.state`` instead of ``Depends``."""
+
+    def test_endpoints_do_not_use_depends(self):
+        import inspect
+
+        from fastapi.params import Depends
+
+        from recursive_neon import main
+
+        for fn in (
+            main.root,
+            main.health_check,
+            main.list_npcs,
+            main.get_npc,
+            main.chat_with_npc,
+            main.get_stats,
+            main.websocket_endpoint,
+        ):
+            for param in inspect.signature(fn).parameters.values():
+                assert not isinstance(param.default, Depends), fn.__name__
+
+
+class TestServerEntryPoint:
+    def test_main_pins_fast_drivers(self, monkeypatch):
+        import sys
+        from unittest.mock import Mock
+
+        import uvicorn
+
+        from recursive_neon import main
+
+        run = Mock()
+        monkeypatch.setattr(uvicorn, "run", run)
+        main.main()
+        kwargs = run.call_args.kwargs
+        assert kwargs["http"] == "httptools"
+        assert kwargs["ws"] == "websockets"
+        expected_loop = "asyncio" if sys.platform == "win32" else "uvloop"
+        assert kwargs["loop"] == expected_loop
 
 
 class TestLifespanNPCPersistence:
@@ -332,3 +600,26 @@ class TestLifespanNPCPersistence:
                     "lifespan should call save_npcs_to_disk to persist NPC state"
                 )
                 break
+
+    async def test_shutdown_saves_are_independent(
+        self, container, monkeypatch, tmp_path
+    ):
+        """A failing NPC save must not prevent the app-state save (and vice versa)."""
+        from unittest.mock import Mock
+
+        from recursive_neon import main
+
+        monkeypatch.setattr(
+            main.ServiceFactory, "create_production_container", lambda: container
+        )
+        monkeypatch.setattr(main.settings, "data_dir", tmp_path)
+        container.app_service.save_all_to_disk = Mock()
+        container.npc_manager.save_npcs_to_disk = Mock(side_effect=OSError("disk"))
+
+        async with main.lifespan(main.app):
+            pass
+        del main.app.state.services
+
+        container.app_service.save_all_to_disk.assert_called_once_with(str(tmp_path))
+        container.npc_manager.save_npcs_to_disk.assert_called_once_with(str(tmp_path))
+        container.process_manager.stop.assert_awaited_once()
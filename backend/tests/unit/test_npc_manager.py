@@ -181,6 +181,23 @@ class TestNPCManagerWithDependencyInjection:
         # Relationship should have increased
         assert sample_npc.memory.relationship_level > initial_relationship
 
+    @pytest.mark.asyncio
+    async def test_chat_rude_message_lowers_relationship(
+        self, npc_manager, sample_npc, mock_llm
+    ):
+        """Negative keywords match case-insensitively and cost 5 points."""
+        from langchain_core.messages import AIMessage
+
+        mock_llm.ainvoke.return_value = AIMessage(content="Hmph.")
+        npc_manager.register_npc(sample_npc)
+        initial_relationship = sample_npc.memory.relationship_level
+
+        await npc_manager.chat(
+            npc_id=sample_npc.id, message="I HATE waiting", player_id="test_player"
+        )
+
+        assert sample_npc.memory.relationship_level == initial_relationship - 5
+
     @pytest.mark.asyncio
     async def test_chat_error_handling(self, npc_manager, sample_npc, mock_llm):
         """Test that chat errors propagate and conversation history is rolled back."""
@@ -344,6 +361,24 @@ class TestNPCMemoryTruncation:
         # Default is 50
         assert len(npc.memory.conversation_history) == 50
 
+    def test_add_to_memory_trims_in_place(self):
+        npc = NPC(
+            id="in_place_test",
+            name="T",
+            personality=NPCPersonality.FRIENDLY,
+            role=NPCRole.INFORMANT,
+            background="bg",
+            occupation="Test",
+            location="Lab",
+            greeting="Hi",
+            conversation_style="casual",
+        )
+        history = npc.memory.conversation_history
+        for i in range(5):
+            npc.add_to_memory("user", f"msg {i}", max_history=3)
+        assert npc.memory.conversation_history is history
+        assert [m.content for m in history] == ["msg 2", "msg 3", "msg 4"]
+
 
 class TestNPCSystemPrompt:
     """Tests for the refined NPC system prompt."""
@@ -365,6 +400,30 @@ class TestNPCSystemPrompt:
         assert "1-3 sentences" in prompt
         assert "No meta-commentary" in prompt
 
+    def test_prompt_relationship_thresholds(self):
+        npc = NPC(
+            id="test",
+            name="Test",
+            personality=NPCPersonality.FRIENDLY,
+            role=NPCRole.INFORMANT,
+            background="bg",
+            occupation="Tester",
+            location="Lab",
+            greeting="Hi",
+            conversation_style="casual",
+        )
+        expected = {
+            -100: "cold and distrustful",
+            -51: "cold and distrustful",
+            -50: "neutral",
+            50: "neutral",
+            51: "friendly and trusting",
+            100: "friendly and trusting",
+        }
+        for level, desc in expected.items():
+            npc.memory.relationship_level = level
+            assert desc in npc.get_system_prompt()
+
 
 class TestNPCPersistence:
     """Tests for NPC save/load persistence."""
@@ -392,6 +451,7 @@ class TestNPCPersistence:
         manager.register_npc(npc)
 
         manager.save_npcs_to_disk(str(tmp_path))
+        assert [p.name for p in tmp_path.iterdir()] == ["npcs.json"]
 
         # Load into fresh manager
         fresh = NPCManager(llm=mock_llm)
@@ -1,5 +1,8 @@
 """Tests for OllamaClient."""
 
+import json
+
+import httpx
 import pytest
 
 from recursive_neon.services.ollama_client import OllamaClient
@@ -20,3 +23,64 @@ class TestOllamaClientContextManager:
         client = OllamaClient(host="127.0.0.1", port=99999)
         await client.close()
         await client.close()  # Should not raise
+
+
+@pytest.mark.unit
+class TestOllamaClientPreload:
+    """Test model preloading (warm-up before the first chat)."""
+
+    async def test_preload_posts_empty_generate(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"done": True})
+
+        client = OllamaClient(
+            host="127.0.0.1",
+            port=11434,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        async with client:
+            assert await client.preload_model("qwen3:4b", keep_alive="5m")
+
+        assert requests[0].url.path == "/api/generate"
+        assert json.loads(requests[0].content) == {
+            "model": "qwen3:4b",
+            "keep_alive": "5m",
+        }
+
+    async def test_preload_failure_returns_false(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"error": "model not found"})
+
+        client = OllamaClient(
+            host="127.0.0.1",
+            port=11434,
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        async with client:
+            assert not await client.preload_model("missing")
+
+
+@pytest.mark.unit
+class TestOllamaClientConnectionPool:
+    """Test HTTP client construction."""
+
+    async def test_default_client_is_pooled(self):
+        async with OllamaClient(host="127.0.0.1", port=11434) as client:
+            assert str(client.client.base_url) == "http://127.0.0.1:11434"
+
+    async def test_injected_client_is_used_and_left_open(self):
+        shared = httpx.AsyncClient()
+        try:
+            async with OllamaClient(client=shared) as client:
+                assert client.client is shared
+            assert not shared.is_closed
+        finally:
+            await shared.aclose()
+
+    async def test_owned_client_is_closed(self):
+        async with OllamaClient() as client:
+            pass
+        assert client.client.is_closed
@@ -371,6 +371,17 @@ class TestTerminalSessionRawMode:
         assert msg == {"type": "mode", "mode": "cooked"}
         await mgr.remove_session(session.session_id)
 
+    async def test_mode_frames_are_not_shared(self, container):
+        """Each mode switch queues its own dict, so consumers may mutate it."""
+        mgr = TerminalSessionManager(container=container)
+        session = mgr.create_session()
+        session._enter_raw_mode()
+        first = session.output_queue.get_nowait()
+        first["mode"] = "tampered"
+        session._enter_raw_mode()
+        assert session.output_queue.get_nowait() == {"type": "mode", "mode": "raw"}
+        await mgr.remove_session(session.session_id)
+
     async def test_stop_sends_eof_to_key_queue(self, container):
         """Stopping a session should send None to key_queue for TUI cleanup."""
         mgr = TerminalSessionManager(container=container)